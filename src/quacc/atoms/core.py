@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import lru_cache
 from hashlib import md5
 from logging import getLogger
 from typing import TYPE_CHECKING
@@ -10,7 +11,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 from ase.filters import Filter
 from ase.io.jsonio import encode
-from pymatgen.io.ase import AseAtomsAdaptor
+from pymatgen.core.periodic_table import Element
 
 if TYPE_CHECKING:
     from hashlib import _Hash
@@ -102,13 +103,27 @@ def check_is_metal(atoms: Atoms) -> bool:
     bool
         True if the structure is likely a metal; False otherwise
     """
-    struct = (
-        AseAtomsAdaptor().get_structure(atoms)
-        if atoms.pbc.any()
-        else AseAtomsAdaptor().get_molecule(atoms, charge_spin_check=False)
+    return all(
+        _element_is_metal(symbol) for symbol in set(atoms.get_chemical_symbols())
     )
 
-    return all(k.is_metal for k in struct.composition)
+
+@lru_cache
+def _element_is_metal(symbol: str) -> bool:
+    """
+    Checks if an element is a metal, with the result cached per symbol.
+
+    Parameters
+    ----------
+    symbol
+        Chemical symbol of the element.
+
+    Returns
+    -------
+    bool
+        True if the element is a metal; False otherwise
+    """
+    return Element(symbol).is_metal
 
 
 def copy_atoms(atoms: Atoms) -> Atoms:
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from quacc.utils.files import load_yaml_calc
 
 if TYPE_CHECKING:
-    from pathlib import Path
     from typing import Any
 
 
@@ -29,6 +31,59 @@ def load_vasp_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
     dictionary of ASE-style pseudopotentials, and and `elemental_magmoms` is a
     dictionary of element-wise initial magmoms.
 
+    The parsed YAML is cached in memory (keyed on the file path and its
+    modification time) so that repeated instantiations of the `Vasp` calculator
+    with the same preset do not re-read and re-parse the file from disk. A copy
+    of the cached configuration is returned so that the caller can freely
+    mutate it.
+
+    Parameters
+    ----------
+    yaml_path
+        Path to the YAML file.
+
+    Returns
+    -------
+    dict
+        The calculator configuration (i.e. settings).
+    """
+    yaml_path = Path(yaml_path).expanduser()
+
+    try:
+        mtime = yaml_path.stat().st_mtime
+    except OSError:
+        # Defer to the uncached parser, which raises a descriptive error
+        # for missing files.
+        return _parse_vasp_yaml_calc(yaml_path)
+
+    return deepcopy(_parse_vasp_yaml_calc_cached(str(yaml_path), mtime))
+
+
+@lru_cache(maxsize=64)
+def _parse_vasp_yaml_calc_cached(yaml_path: str, mtime: float) -> dict[str, Any]:  # noqa: ARG001
+    """
+    Cached wrapper around `_parse_vasp_yaml_calc`.
+
+    Parameters
+    ----------
+    yaml_path
+        Path to the YAML file.
+    mtime
+        Modification time of the YAML file, used solely to invalidate stale
+        cache entries when the file changes on disk.
+
+    Returns
+    -------
+    dict
+        The calculator configuration (i.e. settings).
+    """
+    return _parse_vasp_yaml_calc(yaml_path)
+
+
+def _parse_vasp_yaml_calc(yaml_path: str | Path) -> dict[str, Any]:
+    """
+    Load and normalize a VASP calculator YAML file from disk.
+
     Parameters
     ----------
     yaml_path
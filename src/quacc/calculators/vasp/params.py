@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
+from functools import lru_cache
 from importlib.util import find_spec
 from logging import getLogger
+from math import prod
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -12,6 +15,7 @@ from ase.calculators.vasp import Vasp as Vasp_
 from monty.dev import requires
 from pymatgen.io.ase import AseAtomsAdaptor
 
+from quacc import get_settings
 from quacc.atoms.core import check_is_metal
 from quacc.utils.dicts import sort_dict
 from quacc.utils.kpts import convert_pmg_kpts
@@ -32,6 +36,9 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger(__name__)
 
+_PARAM_SWAPS_CACHE_SIZE = 128
+_param_swaps_cache: dict[tuple[Any, ...], dict[str, Any]] = {}
+
 
 def get_param_swaps(
     user_calc_params: dict[str, Any],
@@ -60,205 +67,204 @@ def get_param_swaps(
     dict
         The updated user-provided calculator parameters.
     """
+    cache_key = None
+    if get_settings().VASP_COPILOT_CACHE:
+        cache_key = _param_swaps_cache_key(
+            user_calc_params, input_atoms, pmg_kpts, incar_copilot_mode
+        )
+        if cache_key is not None and cache_key in _param_swaps_cache:
+            return deepcopy(_param_swaps_cache[cache_key])
+
     is_metal = check_is_metal(input_atoms)
-    calc = Vasp_(**remove_unused_flags(user_calc_params))
+    cleaned_user_params = remove_unused_flags(user_calc_params)
+    # Copy so that the in-place swaps below do not alias cleaned_user_params
+    params = dict(_derive_xc_params(cleaned_user_params))
     max_Z = input_atoms.get_atomic_numbers().max()
 
     # ----------------------------
     # General INCAR swaps
     # ----------------------------
     if incar_copilot_mode.lower() not in {"off", "critical"}:
-        if calc.parameters.get("lmaxmix", 2) < 6 and max_Z > 56:
+        if params.get("lmaxmix", 2) < 6 and max_Z > 56:
             LOGGER.info("Recommending LMAXMIX = 6 because you have f electrons.")
-            calc.set(lmaxmix=6)
-        elif calc.parameters.get("lmaxmix", 2) < 4 and max_Z > 20:
+            params["lmaxmix"] = 6
+        elif params.get("lmaxmix", 2) < 4 and max_Z > 20:
             LOGGER.info("Recommending LMAXMIX = 4 because you have d electrons.")
-            calc.set(lmaxmix=4)
+            params["lmaxmix"] = 4
 
         if (
-            calc.parameters.get("luse_vdw", False)
-            or calc.parameters.get("lhfcalc", False)
-            or calc.parameters.get("ldau", False)
-            or calc.parameters.get("ldau_luj", {})
-            or calc.parameters.get("metagga", "")
-        ) and not calc.parameters.get("lasph"):
+            params.get("luse_vdw", False)
+            or params.get("lhfcalc", False)
+            or params.get("ldau", False)
+            or params.get("ldau_luj", {})
+            or params.get("metagga", "")
+        ) and not params.get("lasph"):
             LOGGER.info(
                 "Recommending LASPH = True because you have a +U, vdW, meta-GGA, or hybrid calculation."
             )
-            calc.set(lasph=True)
+            params["lasph"] = True
 
-        if calc.parameters.get("metagga", "") and (
-            calc.parameters.get("algo", "normal").lower() != "all"
+        if params.get("metagga", "") and (
+            params.get("algo", "normal").lower() != "all"
         ):
             LOGGER.info(
                 "Recommending ALGO = All because you have a meta-GGA calculation."
             )
-            calc.set(algo="all", isearch=1)
+            params.update(algo="all", isearch=1)
 
-        if (
-            is_metal
-            and (calc.parameters.get("ismear", 1) < 0)
-            and (calc.parameters.get("nsw", 0) > 0)
-        ):
+        if is_metal and (params.get("ismear", 1) < 0) and (params.get("nsw", 0) > 0):
             LOGGER.info(
                 "Recommending ISMEAR = 1 and SIGMA = 0.1 because you are likely relaxing a metal."
             )
-            calc.set(ismear=1, sigma=0.1)
+            params.update(ismear=1, sigma=0.1)
 
-        if (
-            pmg_kpts
-            and pmg_kpts.get("line_density")
-            and calc.parameters.get("ismear", 1) != 0
-        ):
+        if pmg_kpts and pmg_kpts.get("line_density") and params.get("ismear", 1) != 0:
             LOGGER.info(
                 "Recommending ISMEAR = 0 and SIGMA = 0.01 because you are doing a line mode calculation."
             )
-            calc.set(ismear=0, sigma=0.01)
+            params.update(ismear=0, sigma=0.01)
 
-        if calc.parameters.get("ismear", 1) == 0 and (
-            calc.parameters.get("sigma", 0.2) > 0.05
-        ):
+        if params.get("ismear", 1) == 0 and (params.get("sigma", 0.2) > 0.05):
             LOGGER.info(
                 "Recommending SIGMA = 0.05 because ISMEAR = 0 was requested with SIGMA > 0.05."
             )
-            calc.set(sigma=0.05)
+            params["sigma"] = 0.05
 
-        if calc.parameters.get("nsw", 0) > 0 and calc.parameters.get("laechg", False):
+        if params.get("nsw", 0) > 0 and params.get("laechg", False):
             LOGGER.info(
                 "Recommending LAECHG = False because you have NSW > 0. LAECHG is supposedly not compatible with NSW > 0."
             )
-            calc.set(laechg=False)
+            params["laechg"] = False
 
-        if calc.parameters.get("ldauprint", 0) == 0 and (
-            calc.parameters.get("ldau", False) or calc.parameters.get("ldau_luj", {})
+        if params.get("ldauprint", 0) == 0 and (
+            params.get("ldau", False) or params.get("ldau_luj", {})
         ):
             LOGGER.info("Recommending LDAUPRINT = 1 because LDAU = True.")
-            calc.set(ldauprint=1)
+            params["ldauprint"] = 1
 
-        if calc.parameters.get("lreal", False) and len(input_atoms) < 30:
+        if params.get("lreal", False) and len(input_atoms) < 30:
             LOGGER.info(
                 "Recommending LREAL = False because you have a small system (< 30 atoms/cell)."
             )
-            calc.set(lreal=False)
+            params["lreal"] = False
 
-        if (
-            calc.parameters.get("lhfcalc", False) is True
-            and calc.parameters.get("isym", 3) < 3
-        ):
+        if params.get("lhfcalc", False) is True and params.get("isym", 3) < 3:
             LOGGER.info(
                 "Recommending ISYM = 3 because you are running a hybrid calculation."
             )
-            calc.set(isym=3)
+            params["isym"] = 3
 
-        if calc.parameters.get("lsorbit", False):
+        if params.get("lsorbit", False):
             LOGGER.info(
                 "Recommending ISYM = -1 because you are running an SOC calculation."
             )
-            calc.set(isym=-1)
+            params["isym"] = -1
 
         if (
-            calc.parameters.get("algo", "normal") in ("all", "conjugate")
-            and calc.parameters.get("isearch", 0) != 1
+            params.get("algo", "normal") in ("all", "conjugate")
+            and params.get("isearch", 0) != 1
         ):
             LOGGER.info("Recommending ISEARCH = 1 because you have ALGO = All.")
-            calc.set(isearch=1)
+            params["isearch"] = 1
 
     # ----------------------------
     # Critical INCAR swaps
     # ----------------------------
-    pre_critical_params = dict(calc.parameters)
+    pre_critical_params = dict(params)
     if incar_copilot_mode.lower() != "off":
-        if not calc.parameters.get("lorbit", False) and (
-            calc.parameters.get("ispin", 1) == 2
-            or np.any(input_atoms.get_initial_magnetic_moments() != 0)
+        # Read the magmoms off the raw array to avoid the copy made by
+        # Atoms.get_initial_magnetic_moments()
+        initial_mags = input_atoms.arrays.get("initial_magmoms")
+        if not params.get("lorbit", False) and (
+            params.get("ispin", 1) == 2
+            or (initial_mags is not None and initial_mags.any())
         ):
             LOGGER.info(
                 "Recommending LORBIT = 11 because you have a spin-polarized calculation."
             )
-            calc.set(lorbit=11)
+            params["lorbit"] = 11
 
+        kpts = params.get("kpts", (1, 1, 1))
+        # An explicit (2D) k-point list has one k-point per row
+        nkpts = (
+            None if kpts is None else (len(kpts) if np.ndim(kpts) == 2 else prod(kpts))
+        )
         if (
-            calc.parameters.get("ismear", 1) == -5
-            and (calc.kpts is not None and np.prod(calc.kpts) < 4)
-            and calc.parameters.get("kspacing", None) is None
+            params.get("ismear", 1) == -5
+            and (nkpts is not None and nkpts < 4)
+            and params.get("kspacing") is None
         ):
             LOGGER.info(
                 "Recommending ISMEAR = 0 because you don't have enough k-points for ISMEAR = -5."
             )
-            calc.set(ismear=0)
+            params["ismear"] = 0
 
-        if (
-            calc.parameters.get("kspacing", 0.5) > 0.5
-            and calc.parameters.get("ismear", 1) == -5
-        ):
+        if params.get("kspacing", 0.5) > 0.5 and params.get("ismear", 1) == -5:
             LOGGER.info(
                 "Recommending ISMEAR = 0 because KSPACING is likely too large for ISMEAR = -5."
             )
-            calc.set(ismear=0)
+            params["ismear"] = 0
 
-        if calc.parameters.get("ismear", 1) == -5 and calc.parameters.get(
-            "algo", "normal"
-        ) in ("all", "conjugate", "damped"):
+        if params.get("ismear", 1) == -5 and params.get("algo", "normal") in (
+            "all",
+            "conjugate",
+            "damped",
+        ):
             LOGGER.info(
                 "Recommending ALGO = Normal because your ALGO is not compatible with ISMEAR = -5."
             )
-            calc.set(algo="normal")
+            params["algo"] = "normal"
 
-        if calc.parameters.get("lhfcalc", False) and (
-            calc.parameters.get("algo", "normal").lower() != "normal"
+        if params.get("lhfcalc", False) and (
+            params.get("algo", "normal").lower() != "normal"
         ):
             LOGGER.info(
                 "Recommending ALGO = Normal because you have a hybrid calculation."
             )
-            calc.set(algo="normal")
+            params["algo"] = "normal"
 
         if (
-            calc.parameters.get("ncore", 1) > 1
-            or (calc.parameters.get("npar") and calc.parameters.get("npar", 1) > 1)
+            params.get("ncore", 1) > 1
+            or (params.get("npar") and params.get("npar", 1) > 1)
         ) and (
-            calc.parameters.get("lhfcalc", False) is True
-            or calc.parameters.get("lrpa", False) is True
-            or calc.parameters.get("lepsilon", False) is True
-            or calc.parameters.get("ibrion", 0) in [5, 6, 7, 8]
+            params.get("lhfcalc", False) is True
+            or params.get("lrpa", False) is True
+            or params.get("lepsilon", False) is True
+            or params.get("ibrion", 0) in [5, 6, 7, 8]
         ):
             LOGGER.info(
                 "Recommending NCORE = 1 because NCORE/NPAR is not compatible with this job type."
             )
-            calc.set(ncore=1, npar=None)
+            params.update(ncore=1, npar=None)
 
-        if not calc.parameters.get("npar") and not calc.parameters.get("ncore"):
+        if not params.get("npar") and not params.get("ncore"):
             ncores = psutil.cpu_count(logical=False) or 1
             for ncore in range(int(np.sqrt(ncores)), ncores):
                 if ncores % ncore == 0:
                     LOGGER.info(
                         f"Recommending NCORE = {ncore} per the sqrt(# cores) suggestion by VASP."
                     )
-                    calc.set(ncore=ncore, npar=None)
+                    params.update(ncore=ncore, npar=None)
                     break
 
         if (
-            calc.parameters.get("kpar")
-            and (
-                calc.kpts is not None
-                and calc.parameters.get("kpar", 1) > np.prod(calc.kpts)
-            )
-            and calc.float_params["kspacing"] is None
+            params.get("kpar")
+            and (nkpts is not None and params.get("kpar", 1) > nkpts)
+            and params.get("kspacing") is None
         ):
             LOGGER.info(
                 "Recommending KPAR = 1 because you have too few k-points to parallelize."
             )
-            calc.set(kpar=1)
+            params["kpar"] = 1
 
-        if (
-            calc.parameters.get("isif", 2) in (3, 6, 7, 8)
-            and calc.parameters.get("nsw", 0) > 0
-        ):
-            if calc.encut is None:
+        if params.get("isif", 2) in (3, 6, 7, 8) and params.get("nsw", 0) > 0:
+            encut = params.get("encut")
+            if encut is None:
                 LOGGER.warning(
                     "Be careful of Pulay stresses. At the end of your run, re-relax your structure with your current ENCUT or set ENCUT=1.3*max(ENMAX)."
                 )
             if "He" in input_atoms.get_chemical_symbols() and (
-                calc.encut is None or calc.encut < 478.896 * 1.3
+                encut is None or encut < 478.896 * 1.3
             ):
                 LOGGER.warning(
                     "Be careful of Pulay stresses. At the end of your run, re-relax your structure with your current ENCUT or set ENCUT>=623."
@@ -266,10 +272,10 @@ def get_param_swaps(
 
             if (
                 "Li" in input_atoms.get_chemical_symbols()
-                and calc.parameters.get("setups", {})
-                and isinstance(calc.parameters["setups"], dict)
-                and calc.parameters["setups"].get("Li", "") in ("Li_sv", "_sv")
-                and (calc.encut is None or calc.encut < 499.034 * 1.3)
+                and params.get("setups", {})
+                and isinstance(params["setups"], dict)
+                and params["setups"].get("Li", "") in ("Li_sv", "_sv")
+                and (encut is None or encut < 499.034 * 1.3)
             ):
                 LOGGER.warning(
                     "Be careful of Pulay stresses. At the end of your run, re-relax your structure with your current ENCUT or set ENCUT>=650."
@@ -277,38 +283,38 @@ def get_param_swaps(
 
         if (
             (
-                calc.parameters.get("xc", "").lower() == "r2scan"
-                or calc.parameters.get("metagga", "").lower() == "r2scan"
+                params.get("xc", "").lower() == "r2scan"
+                or params.get("metagga", "").lower() == "r2scan"
             )
-            and calc.parameters.get("ivdw", 0) == 13
-            and not calc.parameters.get("vdw_s6")
-            and not calc.parameters.get("vdw_s8")
-            and not calc.parameters.get("vdw_a1")
-            and not calc.parameters.get("vdw_a2")
+            and params.get("ivdw", 0) == 13
+            and not params.get("vdw_s6")
+            and not params.get("vdw_s8")
+            and not params.get("vdw_a1")
+            and not params.get("vdw_a2")
         ):
             LOGGER.info(
                 "Recommending VDW_S6, VDW_S8, VDW_A1, VDW_A2 parameters for r2SCAN-D4."
             )
-            calc.set(
+            params.update(
                 vdw_s6=1.0, vdw_s8=0.60187490, vdw_a1=0.51559235, vdw_a2=5.77342911
             )
 
         if (
-            calc.parameters.get("lhfcalc", False)
-            and calc.parameters.get("hfscreen", 0) == 0.2
-            and calc.parameters.get("ivdw", 1) == 12
-            and not calc.parameters.get("vdw_s6")
-            and not calc.parameters.get("vdw_s8")
-            and not calc.parameters.get("vdw_a1")
-            and not calc.parameters.get("vdw_a2")
+            params.get("lhfcalc", False)
+            and params.get("hfscreen", 0) == 0.2
+            and params.get("ivdw", 1) == 12
+            and not params.get("vdw_s6")
+            and not params.get("vdw_s8")
+            and not params.get("vdw_a1")
+            and not params.get("vdw_a2")
         ):
             LOGGER.info(
                 "Recommending VDW_S6, VDW_S8, VDW_A1, VDW_A2 parameters for HSE06-D3(BJ)."
             )
-            calc.set(vdw_s6=1.0, vdw_s8=2.310, vdw_a1=0.383, vdw_a2=5.685)
+            params.update(vdw_s6=1.0, vdw_s8=2.310, vdw_a1=0.383, vdw_a2=5.685)
 
-        if input_atoms.get_chemical_formula() == "O2" and all(
-            input_atoms.get_initial_magnetic_moments() == 0
+        if input_atoms.get_chemical_formula() == "O2" and (
+            initial_mags is None or not initial_mags.any()
         ):
             LOGGER.warning(
                 "You are running O2 without magnetic moments, but its ground state should have 2 unpaired electrons!"
@@ -318,16 +324,14 @@ def get_param_swaps(
     # Finalize INCAR swaps
     # ----------------------------
     critical_swap_changes = {
-        k: v
-        for k, v in calc.parameters.items()
-        if _params_differ(pre_critical_params.get(k), v)
+        k: v for k, v in params.items() if _params_differ(pre_critical_params.get(k), v)
     }
-    recommended_params = dict(calc.parameters)
+    recommended_params = dict(params)
 
     if incar_copilot_mode == "aggressive":
-        new_parameters = calc.parameters
+        new_parameters = params
     else:
-        new_parameters = (calc.parameters | user_calc_params) | critical_swap_changes
+        new_parameters = (params | cleaned_user_params) | critical_swap_changes
 
     if added_parameters := {
         k: new_parameters[k] for k in set(new_parameters) - set(user_calc_params)
@@ -355,6 +359,19 @@ def get_param_swaps(
                 f"{k.upper()} was *not* changed from {current!r} to {recommended!r} to respect the user's decisions."
             )
 
+    # Drop None-valued INCAR flags introduced by the swaps (e.g. NPAR) so the
+    # caller does not need a second `remove_unused_flags` pass
+    input_param_keys = _ase_input_param_keys()
+    new_parameters = {
+        k: v
+        for k, v in new_parameters.items()
+        if v is not None or k in input_param_keys
+    }
+
+    if cache_key is not None:
+        if len(_param_swaps_cache) >= _PARAM_SWAPS_CACHE_SIZE:
+            _param_swaps_cache.pop(next(iter(_param_swaps_cache)))
+        _param_swaps_cache[cache_key] = deepcopy(new_parameters)
     return new_parameters
 
 
@@ -403,15 +420,27 @@ def remove_unused_flags(user_calc_params: dict[str, Any]) -> dict[str, Any]:
         new_user_calc_params.pop("kgamma", None)
 
     # Remove None keys
-    none_keys = [
-        k
+    input_param_keys = _ase_input_param_keys()
+    return {
+        k: v
         for k, v in new_user_calc_params.items()
-        if v is None and k not in Vasp_().input_params
-    ]
-    for none_key in none_keys:
-        del new_user_calc_params[none_key]
+        if v is not None or k in input_param_keys
+    }
 
-    return new_user_calc_params
+
+@lru_cache(maxsize=1)
+def _ase_input_param_keys() -> frozenset[str]:
+    """
+    Get the names of the ASE-style (i.e. non-INCAR) input parameters of the
+    `Vasp` calculator, cached so that a scratch calculator is only ever
+    instantiated once.
+
+    Returns
+    -------
+    frozenset
+        The ASE-style input parameter names.
+    """
+    return frozenset(Vasp_().input_params)
 
 
 def normalize_params(user_calc_params: dict[str, Any]) -> dict[str, Any]:
@@ -454,9 +483,12 @@ def set_auto_dipole(
     dict
         The updated user-provided calculator parameters.
     """
-    com = input_atoms.get_center_of_mass(scaled=True)
     if "dipol" not in user_calc_params:
-        user_calc_params["dipol"] = com
+        # Equivalent to input_atoms.get_center_of_mass(scaled=True), computed
+        # directly (and only when needed) to skip the intermediate array copies
+        masses = input_atoms.get_masses()
+        com = masses @ input_atoms.get_positions() / masses.sum()
+        user_calc_params["dipol"] = input_atoms.cell.scaled_positions(com)
     if "idipol" not in user_calc_params:
         user_calc_params["idipol"] = 3
     if "ldipol" not in user_calc_params:
@@ -642,6 +674,100 @@ class MPtoASEConverter:
         return full_input_params
 
 
+def _derive_xc_params(user_calc_params: dict[str, Any]) -> dict[str, Any]:
+    """
+    Expand the `xc` shortcut into the INCAR flags ASE would set for it.
+
+    This mirrors `ase.calculators.vasp.create_input.GenerateVaspInput.set_xc_params`
+    (e.g. `xc="pbe"` implies `gga="PE"` and `pp="PBE"`) so that the INCAR swaps can
+    reason about a plain parameter dictionary without constructing a throwaway ASE
+    calculator. Any flags explicitly set by the user take precedence over the
+    derived ones.
+
+    Parameters
+    ----------
+    user_calc_params
+        The user-provided calculator parameters.
+
+    Returns
+    -------
+    dict
+        The updated user-provided calculator parameters.
+    """
+    xc = user_calc_params.get("xc")
+    if not xc or xc.lower() not in Vasp_.xc_defaults:
+        return user_calc_params
+
+    xc_params = Vasp_.xc_defaults[xc.lower()]
+    if "pp" not in xc_params:
+        # XC defaults to PBE pseudopotentials
+        xc_params = {"pp": "PBE"} | xc_params
+    return xc_params | user_calc_params
+
+
+def _param_swaps_cache_key(
+    user_calc_params: dict[str, Any],
+    input_atoms: Atoms,
+    pmg_kpts: dict[Literal["line_density", "kppvol", "kppa"], float] | None,
+    incar_copilot_mode: str,
+) -> tuple[Any, ...] | None:
+    """
+    Build a hashable fingerprint of the `get_param_swaps` inputs.
+
+    Parameters
+    ----------
+    user_calc_params
+        The user-provided calculator parameters.
+    input_atoms
+        The input atoms.
+    pmg_kpts
+        The pmg_kpts kwarg.
+    incar_copilot_mode
+        INCAR copilot mode.
+
+    Returns
+    -------
+    tuple | None
+        The cache key, or None if the inputs cannot be fingerprinted.
+    """
+    initial_mags = input_atoms.arrays.get("initial_magmoms")
+    try:
+        cache_key = (
+            _freeze(user_calc_params),
+            input_atoms.numbers.tobytes(),
+            None if initial_mags is None else initial_mags.tobytes(),
+            _freeze(pmg_kpts),
+            incar_copilot_mode,
+        )
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert a parameter value into a hashable equivalent.
+
+    Parameters
+    ----------
+    value
+        The value to convert.
+
+    Returns
+    -------
+    Any
+        A hashable stand-in for the value.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 def _params_differ(a, b) -> bool:
     """Compare two parameter values, handling NumPy arrays."""
     if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import subprocess
 from logging import getLogger
+from math import prod
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -17,7 +18,6 @@ from quacc.calculators.vasp.io import load_vasp_yaml_calc
 from quacc.calculators.vasp.params import (
     get_param_swaps,
     normalize_params,
-    remove_unused_flags,
     set_auto_dipole,
     set_pmg_kpts,
 )
@@ -35,6 +35,10 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger(__name__)
 
+# Names of ASE's built-in setups (e.g. "recommended"), bound once so the
+# membership test in __init__ does not re-resolve the module attribute
+_ASE_DEFAULT_SETUP_KEYS = frozenset(ase_setups.setups_defaults)
+
 
 AIMD_CUSTODIAN_HANDLERS = [
     "VaspErrorHandler",
@@ -219,11 +223,11 @@ class Vasp(Vasp_):
         # Return vanilla ASE command
         if kspacing := self.user_calc_params.get("kspacing"):
             nk = kspacing_to_kpts(kspacing, self.input_atoms)
-            use_gamma = np.prod(nk) == 1
-        elif np.prod(self.user_calc_params.get("kpts", [1, 1, 1])) == 1:
-            use_gamma = True
+            use_gamma = prod(nk) == 1
         else:
-            use_gamma = False
+            kpts = self.user_calc_params.get("kpts", [1, 1, 1])
+            # Explicit (2D) k-point lists are never gamma-only
+            use_gamma = np.ndim(kpts) == 1 and prod(kpts) == 1
 
         vasp_cmd = (
             self._settings.VASP_GAMMA_CMD if use_gamma else self._settings.VASP_CMD
@@ -266,7 +270,7 @@ class Vasp(Vasp_):
         # setups from a YAML file
         if (
             isinstance(self.user_calc_params.get("setups"), str | Path)
-            and self.user_calc_params["setups"] not in ase_setups.setups_defaults
+            and self.user_calc_params["setups"] not in _ASE_DEFAULT_SETUP_KEYS
         ):
             self.user_calc_params["setups"] = load_vasp_yaml_calc(
                 self._settings.VASP_PRESET_DIR / self.user_calc_params["setups"]
@@ -320,7 +324,7 @@ class Vasp(Vasp_):
         )
 
         # Clean up the user calc parameters
-        self.user_calc_params = sort_dict(remove_unused_flags(self.user_calc_params))
+        self.user_calc_params = sort_dict(self.user_calc_params)
 
     def _run(
         self,
@@ -6,24 +6,6 @@ import os
 import shlex
 from typing import TYPE_CHECKING
 
-from custodian.custodian import Custodian
-from custodian.vasp.handlers import (
-    FrozenJobErrorHandler,
-    IncorrectSmearingHandler,
-    KspacingMetalHandler,
-    LargeSigmaHandler,
-    MeshSymmetryErrorHandler,
-    NonConvergingErrorHandler,
-    PositiveEnergyErrorHandler,
-    PotimErrorHandler,
-    StdErrHandler,
-    UnconvergedErrorHandler,
-    VaspErrorHandler,
-    WalltimeHandler,
-)
-from custodian.vasp.jobs import VaspJob
-from custodian.vasp.validators import VaspFilesValidator, VasprunXMLValidator
-
 from quacc import QuaccDefault, get_settings
 
 if TYPE_CHECKING:
@@ -86,6 +68,26 @@ def run_custodian(
     list[list[dict]]
         List of errors from each Custodian job.
     """
+    # Deferred import so that merely importing the Vasp calculator does not
+    # pay the custodian import cost
+    from custodian.custodian import Custodian
+    from custodian.vasp.handlers import (
+        FrozenJobErrorHandler,
+        IncorrectSmearingHandler,
+        KspacingMetalHandler,
+        LargeSigmaHandler,
+        MeshSymmetryErrorHandler,
+        NonConvergingErrorHandler,
+        PositiveEnergyErrorHandler,
+        PotimErrorHandler,
+        StdErrHandler,
+        UnconvergedErrorHandler,
+        VaspErrorHandler,
+        WalltimeHandler,
+    )
+    from custodian.vasp.jobs import VaspJob
+    from custodian.vasp.validators import VaspFilesValidator, VasprunXMLValidator
+
     # Adapted from atomate2.vasp.run.run_vasp
     settings: QuaccSettings = get_settings()
 
@@ -21,7 +21,9 @@ if TYPE_CHECKING:
     from quacc.wflow_tools.job_argument import Copy
 
 
-_LABEL = OrcaTemplate()._label  # skipcq: PYL-W0212
+# Read the label off the class rather than instantiating an OrcaTemplate
+# at import time just to learn the file prefix.
+_LABEL = OrcaTemplate._label  # skipcq: PYL-W0212
 GEOM_FILE = f"{_LABEL}.xyz"
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import psutil
@@ -20,6 +21,20 @@ if TYPE_CHECKING:
     from quacc.wflow_tools.job_argument import Copy
 
 
+@lru_cache
+def _max_nprocs() -> int:
+    """
+    Get the number of physical cores on the machine, cached so that repeated
+    job launches do not re-probe the hardware.
+
+    Returns
+    -------
+    int
+        Number of physical cores, with a floor of 1.
+    """
+    return psutil.cpu_count(logical=False) or 1
+
+
 @job
 def static_job(
     atoms: Atoms,
@@ -69,7 +84,7 @@ def static_job(
         Dictionary of results
     """
     additional_fields = {"name": "ORCA Static"} | (additional_fields or {})
-    nprocs = (psutil.cpu_count(logical=False) if nprocs == "max" else nprocs) or 1
+    nprocs = (_max_nprocs() if nprocs == "max" else nprocs) or 1
     default_inputs = [xc, basis, "engrad", "normalprint"]
     default_blocks = [f"%pal nprocs {nprocs} end"]
 
@@ -138,7 +153,7 @@ def relax_job(
         Dictionary of results
     """
     additional_fields = {"name": "ORCA Relax"} | (additional_fields or {})
-    nprocs = (psutil.cpu_count(logical=False) if nprocs == "max" else nprocs) or 1
+    nprocs = (_max_nprocs() if nprocs == "max" else nprocs) or 1
 
     default_inputs = [xc, basis, "normalprint", "opt"]
     if run_freq:
@@ -210,7 +225,7 @@ def freq_job(
     RunSchema
         Dictionary of results
     """
-    nprocs = (psutil.cpu_count(logical=False) if nprocs == "max" else nprocs) or 1
+    nprocs = (_max_nprocs() if nprocs == "max" else nprocs) or 1
     default_inputs = [xc, basis, "normalprint", "numfreq" if numerical else "freq"]
     default_blocks = [f"%pal nprocs {nprocs} end"]
 
@@ -279,7 +294,7 @@ def ase_relax_job(
     OptSchema
         Dictionary of results
     """
-    nprocs = (psutil.cpu_count(logical=False) if nprocs == "max" else nprocs) or 1
+    nprocs = (_max_nprocs() if nprocs == "max" else nprocs) or 1
     default_inputs = [xc, basis, "engrad", "normalprint"]
     default_blocks = [f"%pal nprocs {nprocs} end"]
 
@@ -361,7 +376,7 @@ def ase_quasi_irc_job(
     OptSchema
         Dictionary of results
     """
-    nprocs = (psutil.cpu_count(logical=False) if nprocs == "max" else nprocs) or 1
+    nprocs = (_max_nprocs() if nprocs == "max" else nprocs) or 1
     default_inputs = [xc, basis, "engrad", "normalprint"]
     default_blocks = [f"%pal nprocs {nprocs} end"]
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from importlib.util import find_spec
 from typing import TYPE_CHECKING
 
@@ -21,6 +22,32 @@ if TYPE_CHECKING:
 
     from quacc.types import OptParams, OptSchema, RunSchema, VibKwargs, VibThermoSchema
 
+_OMP_ATOM_CUTOFF = 100
+
+
+def _limit_omp_threads(atoms: Atoms) -> None:
+    """
+    Limit tblite's OpenMP threading for small systems.
+
+    For small molecules, the OpenMP thread-management overhead in tblite
+    outweighs any parallel speedup, so default to a single thread unless the
+    user has already set `OMP_NUM_THREADS` explicitly. This must run before
+    `tblite.ase` is first imported: the OpenMP runtime reads the environment
+    once when the compiled extension loads, so the setting has no effect if
+    the runtime is already in the process.
+
+    Parameters
+    ----------
+    atoms
+        Atoms object
+
+    Returns
+    -------
+    None
+    """
+    if len(atoms) < _OMP_ATOM_CUTOFF:
+        os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 
 @job
 @requires(has_tblite, "tblite must be installed. Refer to the quacc documentation.")
@@ -52,6 +79,7 @@ def static_job(
         Dictionary of results from [quacc.schemas.ase.Summarize.run][].
         See the type-hint for the data structure.
     """
+    _limit_omp_threads(atoms)
     from tblite.ase import TBLite
 
     calc_defaults = {"method": method}
@@ -101,6 +129,7 @@ def relax_job(
         Dictionary of results from [quacc.schemas.ase.Summarize.opt][].
         See the type-hint for the data structure.
     """
+    _limit_omp_threads(atoms)
     from tblite.ase import TBLite
 
     opt_params = opt_params or {}
@@ -155,6 +184,7 @@ def freq_job(
     VibThermoSchema
         Dictionary of results
     """
+    _limit_omp_threads(atoms)
     from tblite.ase import TBLite
 
     vib_kwargs = vib_kwargs or {}
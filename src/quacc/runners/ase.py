@@ -232,9 +232,11 @@ class Runner(BaseRunner):
         if optimizer.__name__ == "Sella":
             self._set_sella_kwargs(merged_optimizer_kwargs)
 
-        # Define the Trajectory object
+        # Define the Trajectory object, buffering the writes so each
+        # optimization step does not issue its own syscall
         traj_file = self.tmpdir / traj_filename
-        traj = Trajectory(traj_file, "w", atoms=self.atoms)
+        traj_fd = traj_file.open("wb", buffering=1024 * 1024)
+        traj = Trajectory(traj_fd, "w", atoms=self.atoms)
         merged_optimizer_kwargs["trajectory"] = traj
 
         # Set volume relaxation constraints, if relevant
@@ -306,6 +308,10 @@ class Runner(BaseRunner):
         # Summarize run
         vib.summary(log=str(self.tmpdir / "vib_summary.log"))
 
+        # Consolidate the per-displacement cache files into a single
+        # combined.json so the cleanup step is not dominated by 6N tiny files
+        vib.combine()
+
         # Perform cleanup operations
         self.cleanup()
 
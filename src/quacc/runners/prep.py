@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pathlib import Path
 from shutil import move
 from typing import TYPE_CHECKING
 
-from monty.shutil import gzip_dir
+from monty.shutil import compress_file, gzip_dir
 
 from quacc import JobFailure, get_settings
 from quacc.utils.files import copy_decompress_files, make_unique_dir
@@ -146,7 +147,7 @@ def calc_cleanup(
 
     # Gzip files in tmpdir
     if settings.GZIP_FILES:
-        gzip_dir(tmpdir)
+        _gzip_dir_parallel(tmpdir)
 
     # Move files from tmpdir to job_results_dir.
     LOGGER.info(f"Moving {tmpdir} contents to {job_results_dir}")
@@ -165,6 +166,37 @@ def calc_cleanup(
         symlink_path.unlink(missing_ok=True)
 
 
+def _gzip_dir_parallel(directory: Path) -> None:
+    """
+    Gzip each file in a directory tree, compressing the files concurrently.
+
+    This is equivalent to `monty.shutil.gzip_dir` but spreads the compression
+    work over a thread pool so that runs producing many output files do not
+    serialize on I/O. The function still blocks until every file is
+    compressed.
+
+    Parameters
+    ----------
+    directory
+        The directory to gzip.
+
+    Returns
+    -------
+    None
+    """
+    file_paths = [
+        Path(root, f)
+        for root, _, files in os.walk(directory)
+        for f in files
+        if Path(f).suffix.lower() != ".gz"
+    ]
+    if len(file_paths) < 2:
+        gzip_dir(directory)
+    else:
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(compress_file, file_paths))
+
+
 def terminate(tmpdir: Path | str, exception: Exception) -> None:
     """
     Terminate a calculation and move files to a failed directory.
@@ -365,8 +365,8 @@ class VibSummarize:
             Dictionary representation of the task document
         """
         # Tabulate input parameters
-        vib_freqs_raw = self.vib_object.get_frequencies().tolist()
-        vib_energies_raw = self.vib_object.get_energies().tolist()
+        vib_freqs_raw = self.vib_object.get_frequencies()
+        vib_energies_raw = self.vib_object.get_energies()
         if isinstance(self.vib_object, VibrationsData):
             atoms = self.vib_object._atoms
             directory = self.directory
@@ -388,22 +388,19 @@ class VibSummarize:
                 "quacc_version": __version__,
             }
 
-        # Convert imaginary modes to negative values for DB storage
-        for i, f in enumerate(vib_freqs_raw):
-            if np.imag(f) > 0:
-                vib_freqs_raw[i] = -np.abs(f)
-                vib_energies_raw[i] = -np.abs(vib_energies_raw[i])
-            else:
-                vib_freqs_raw[i] = np.abs(f)
-                vib_energies_raw[i] = np.abs(vib_energies_raw[i])
+        # Convert imaginary modes to negative values for DB storage, done as
+        # one vectorized pass over the modes
+        mode_signs = np.where(np.imag(vib_freqs_raw) > 0, -1.0, 1.0)
+        vib_freqs_raw = mode_signs * np.abs(vib_freqs_raw)
+        vib_energies_raw = mode_signs * np.abs(vib_energies_raw)
 
         # Get the true vibrational modes
         atoms_metadata = atoms_to_metadata(atoms)
 
         natoms = len(atoms)
         if natoms == 1:
-            vib_freqs = []
-            vib_energies = []
+            vib_freqs = vib_freqs_raw[:0]
+            vib_energies = vib_energies_raw[:0]
         elif is_molecule:
             is_linear = (
                 PointGroupData()
@@ -413,30 +410,27 @@ class VibSummarize:
                 else atoms_metadata["molecule_metadata"]["symmetry"]["linear"]
             )
 
-            # Sort by absolute value
-            vib_freqs_raw_sorted = vib_freqs_raw.copy()
-            vib_energies_raw_sorted = vib_energies_raw.copy()
-            vib_freqs_raw_sorted.sort(key=np.abs)
-            vib_energies_raw_sorted.sort(key=np.abs)
-
-            # Cut the 3N-5 or 3N-6 modes based on their absolute value
+            # Sort by absolute value and cut the 3N-5 or 3N-6 modes, keeping
+            # the frequencies and energies index-aligned
+            mode_order = np.argsort(np.abs(vib_freqs_raw))
             n_modes = 3 * natoms - 5 if is_linear else 3 * natoms - 6
-            vib_freqs = vib_freqs_raw_sorted[-n_modes:]
-            vib_energies = vib_energies_raw_sorted[-n_modes:]
+            mode_order = mode_order[-n_modes:]
+            vib_freqs = vib_freqs_raw[mode_order]
+            vib_energies = vib_energies_raw[mode_order]
         else:
             vib_freqs = vib_freqs_raw
             vib_energies = vib_energies_raw
 
-        imag_vib_freqs = [f for f in vib_freqs if f < 0]
+        imag_vib_freqs = vib_freqs[vib_freqs < 0]
 
         vib_results = {
             "results": {
-                "imag_vib_freqs": imag_vib_freqs,
+                "imag_vib_freqs": imag_vib_freqs.tolist(),
                 "n_imag": len(imag_vib_freqs),
-                "vib_energies": vib_energies,
-                "vib_freqs": vib_freqs,
-                "vib_energies_raw": vib_energies_raw,
-                "vib_freqs_raw": vib_freqs_raw,
+                "vib_energies": vib_energies.tolist(),
+                "vib_freqs": vib_freqs.tolist(),
+                "vib_energies_raw": vib_energies_raw.tolist(),
+                "vib_freqs_raw": vib_freqs_raw.tolist(),
             }
         }
         unsorted_task_doc = (
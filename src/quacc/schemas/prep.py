@@ -129,12 +129,13 @@ def set_magmoms(
             # element. If the element isn't in the magmoms dict then set it to
             # mag_default.
             if elemental_mags_dict:
-                initial_mags = np.array(
-                    [
-                        elemental_mags_dict.get(atom.symbol, elemental_mags_default)
-                        for atom in atoms
-                    ]
-                )
+                # Resolve each unique element once instead of per atom
+                symbols = atoms.get_chemical_symbols()
+                mags_by_symbol = {
+                    symbol: elemental_mags_dict.get(symbol, elemental_mags_default)
+                    for symbol in set(symbols)
+                }
+                initial_mags = np.array([mags_by_symbol[symbol] for symbol in symbols])
                 atoms.set_initial_magnetic_moments(initial_mags)
         else:
             pass
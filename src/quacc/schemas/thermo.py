@@ -5,13 +5,14 @@ from __future__ import annotations
 from logging import getLogger
 from typing import TYPE_CHECKING
 
+import numpy as np
 from ase.thermochemistry import HarmonicThermo, IdealGasThermo
 from ase.units import invcm
 from emmet.core.symmetry import PointGroupData
 from pymatgen.io.ase import AseAtomsAdaptor
 
 from quacc import __version__, get_settings
-from quacc.atoms.core import get_spin_multiplicity_attribute
+from quacc.atoms.core import get_atoms_id, get_spin_multiplicity_attribute
 from quacc.schemas.atoms import atoms_to_metadata
 from quacc.utils.dicts import clean_dict
 
@@ -27,6 +28,9 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger(__name__)
 
+_SYMMETRY_CACHE_SIZE = 32
+_symmetry_cache: dict[str, tuple[bool, int]] = {}
+
 
 class ThermoSummarize:
     """
@@ -59,13 +63,13 @@ class ThermoSummarize:
         None
         """
         self.atoms = atoms.copy()
-        # Make sure vibrational freqs are imaginary, not negative
-        vib_freqs_ = vib_freqs.copy()
-        for i, f in enumerate(vib_freqs_):
-            if not isinstance(f, complex) and f < 0:
-                vib_freqs_[i] = complex(0 - f * 1j)
-        self.vib_freqs = vib_freqs_
-        self.vib_energies = [f * invcm for f in self.vib_freqs]
+        # Make sure vibrational freqs are imaginary, not negative. This is
+        # done as a single vectorized pass over the 3N frequencies.
+        vib_freqs_ = np.asarray(vib_freqs, dtype=np.complex128)
+        neg_real = (vib_freqs_.imag == 0) & (vib_freqs_.real < 0)
+        vib_freqs_[neg_real] = -vib_freqs_[neg_real].real * 1j
+        self.vib_freqs = vib_freqs_.tolist()
+        self.vib_energies = (vib_freqs_ * invcm).tolist()
         self.energy = energy
         self.additional_fields = additional_fields or {}
         self._settings = get_settings()
@@ -210,15 +214,13 @@ class ThermoSummarize:
         spin = round((spin_multiplicity - 1) / 2, 1) if spin_multiplicity else 0
 
         # Get symmetry for later use
-        mol = AseAtomsAdaptor().get_molecule(self.atoms, charge_spin_check=False)
-        point_group_data = PointGroupData().from_molecule(mol)
-        sigma = point_group_data.rotation_number or 1
+        is_linear, sigma = _get_symmetry_data(self.atoms)
 
         # Get the geometry
         natoms = len(self.atoms)
         if natoms == 1:
             geometry = "monatomic"
-        elif point_group_data.linear:
+        elif is_linear:
             geometry = "linear"
         else:
             geometry = "nonlinear"
@@ -247,3 +249,34 @@ class ThermoSummarize:
             potentialenergy=self.energy,
             ignore_imag_modes=True,
         )
+
+
+def _get_symmetry_data(atoms: Atoms) -> tuple[bool, int]:
+    """
+    Get the linearity and rotational symmetry number of a molecule.
+
+    The point-group analysis is cached on the hash of the Atoms object so
+    that repeated thermo summaries of the same structure (e.g. chained
+    frequency jobs) do not redo the symmetry perception.
+
+    Parameters
+    ----------
+    atoms
+        ASE Atoms object.
+
+    Returns
+    -------
+    tuple[bool, int]
+        Whether the molecule is linear, and its rotational symmetry number.
+    """
+    atoms_id = get_atoms_id(atoms)
+    if atoms_id not in _symmetry_cache:
+        mol = AseAtomsAdaptor().get_molecule(atoms, charge_spin_check=False)
+        point_group_data = PointGroupData().from_molecule(mol)
+        if len(_symmetry_cache) >= _SYMMETRY_CACHE_SIZE:
+            _symmetry_cache.pop(next(iter(_symmetry_cache)))
+        _symmetry_cache[atoms_id] = (
+            bool(point_group_data.linear),
+            point_group_data.rotation_number or 1,
+        )
+    return _symmetry_cache[atoms_id]
@@ -290,6 +290,18 @@ class QuaccSettings(BaseSettings):
             """
         ),
     )
+    VASP_COPILOT_CACHE: bool = Field(
+        False,
+        description=(
+            """
+            Whether to memoize the INCAR co-pilot swaps keyed on a fingerprint
+            of the calculator parameters and atoms, so that repeated
+            calculator constructions with identical inputs skip the swap
+            logic. Note that the co-pilot log messages are not re-emitted on
+            cache hits.
+            """
+        ),
+    )
     VASP_BADER: bool = Field(
         bool(which("bader")),
         description=(
@@ -59,7 +59,9 @@ def recursive_dict_merge(
     merged = {}
     for i in range(len(dicts) - 1):
         merged = _recursive_dict_pair_merge(old_dict, dicts[i + 1], verbose=verbose)
-        old_dict = deepcopy(merged)
+        # No deepcopy needed: _recursive_dict_pair_merge copies its first
+        # argument before merging
+        old_dict = merged
     return remove_dict_entries(merged, remove_trigger=remove_trigger)
 
 
@@ -113,6 +113,28 @@ def test_isearch():
     assert calc.parameters["isearch"] == 0
 
 
+def test_copilot_cache():
+    from quacc.calculators.vasp.params import _param_swaps_cache
+
+    atoms = bulk("Cu")
+    calc1 = Vasp(atoms, xc="pbe", nsw=10, ismear=-5)
+    assert len(_param_swaps_cache) == 0
+
+    with change_settings({"VASP_COPILOT_CACHE": True}):
+        calc2 = Vasp(atoms, xc="pbe", nsw=10, ismear=-5)
+        assert len(_param_swaps_cache) == 1
+
+        calc3 = Vasp(atoms, xc="pbe", nsw=10, ismear=-5)
+        assert len(_param_swaps_cache) == 1
+        assert calc2.parameters == calc3.parameters == calc1.parameters
+
+        calc4 = Vasp(atoms, xc="pbe", nsw=10, ismear=0)
+        assert len(_param_swaps_cache) == 2
+        assert calc4.parameters != calc1.parameters
+
+    _param_swaps_cache.clear()
+
+
 def test_gga_preset():
     params = {
         "algo": "fast",
@@ -1247,6 +1269,34 @@ def test_dispersion():
     assert calc.parameters["vdw_a2"] == 5.685
 
 
+def test_load_vasp_yaml_calc_cache(tmp_path):
+    from quacc.calculators.vasp.io import load_vasp_yaml_calc
+
+    yaml_path = tmp_path / "test_preset.yaml"
+    yaml_path.write_text("inputs:\n  encut: 520\n  setups:\n    Cu: Cu_pv\n")
+
+    config = load_vasp_yaml_calc(yaml_path)
+    assert config["inputs"]["encut"] == 520
+    assert config["inputs"]["setups"]["Cu"] == "_pv"
+
+    # Mutating the returned dict should not corrupt the cache
+    config["inputs"]["encut"] = 100
+    config["inputs"]["setups"]["Cu"] = "bad"
+    config = load_vasp_yaml_calc(yaml_path)
+    assert config["inputs"]["encut"] == 520
+    assert config["inputs"]["setups"]["Cu"] == "_pv"
+
+    # Changing the file on disk should invalidate the cache
+    yaml_path.write_text("inputs:\n  encut: 400\n")
+    stat = yaml_path.stat()
+    os.utime(yaml_path, (stat.st_atime, stat.st_mtime + 1))
+    config = load_vasp_yaml_calc(yaml_path)
+    assert config["inputs"]["encut"] == 400
+
+    with pytest.raises(FileNotFoundError, match="Cannot find"):
+        load_vasp_yaml_calc(tmp_path / "does_not_exist.yaml")
+
+
 def test_setups():
     atoms = bulk("Cu")
     calc = Vasp(atoms, preset="DefaultSetGGA")